@@ -16,30 +16,22 @@ def format(c):
 
 
 @task
-def bootstrap(c):
-    import comtypes.client
-    comtypes.client.GetModule(r"C:\\Windows\\System32\\UIAutomationCore.dll")
-
-@task(bootstrap)
 def package(c):
     windows = (Path(__file__) / ".." / "windows").resolve()
     if windows.exists():
         shutil.rmtree(windows)
     c.run("briefcase create")
     c.run("briefcase build")
-    # The first time it runs it fails but the next time it works. This is to bootstrap the uia
-    # automation files for comtypes
-    c.run("briefcase run", echo=False, warn=True)
     c.run("briefcase package")
 
 
 @task(package)
 def install(c):
     windows = (Path(__file__) / ".." / "windows").resolve()
-    msi = list(windows.glob("*.msi"))[0]
+    msi = next(windows.glob("*.msi"))
     c.run(str(msi))
 
 
-@task(bootstrap)
+@task
 def exe(c):
     c.run("pyinstaller winsnap.spec")
@@ -1,60 +1,180 @@
 from __future__ import annotations
 
 import argparse
+import bisect
 import collections
 from collections import defaultdict
 import ctypes
+import ctypes.wintypes
 from dataclasses import dataclass
-from functools import reduce
+from functools import cached_property
 import itertools
 import json
 import os
 from pathlib import Path
-import sys
-from time import sleep
+from time import monotonic, sleep
+from typing import NamedTuple
 from uuid import uuid4
 
 from dearpygui import core as dpg_core
 from dearpygui import simple as dpg_simple
-import psutil
-from pywinauto import Desktop
-from pywinauto.controls.uiawrapper import UIAWrapper
 import win32api
 import win32con
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 user32 = ctypes.windll.user32
 dwmapi = ctypes.windll.dwmapi
-user32.SetProcessDPIAware()
-sys.coinit_flags = 2  # STA
+kernel32 = ctypes.windll.kernel32
+shcore = ctypes.windll.shcore
 
 DWMWA_EXTENDED_FRAME_BOUNDS = 9
+DWMWA_CLOAKED = 14
 SPI_GETWORKAREA = 48
-DWORD_DWMWA_EXTENDED_FRAME_BOUNDS = ctypes.wintypes.DWORD(DWMWA_EXTENDED_FRAME_BOUNDS)
+PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+PROCESS_PER_MONITOR_DPI_AWARE = 2
+RECT_SIZE = ctypes.sizeof(ctypes.wintypes.RECT)
+SWP_MOVE_FLAGS = win32con.SWP_NOZORDER | win32con.SWP_NOACTIVATE | win32con.SWP_NOSIZE
+SWP_SIZE_FLAGS = win32con.SWP_NOZORDER | win32con.SWP_NOACTIVATE | win32con.SWP_NOMOVE
+SW_RESTORE = win32con.SW_RESTORE
+# Messages logged with log_debug and log_info are only formatted when running with --debug
+DEBUG = False
+WNDENUMPROC = ctypes.WINFUNCTYPE(ctypes.wintypes.BOOL, ctypes.wintypes.HWND, ctypes.wintypes.LPARAM)
 
 
-class RectangleMixin:
-    """Mixin class for handling rectangles"""
+def declare(function, restype, *argtypes) -> None:
+    """Declare the signature of a Windows API function
 
-    def __repr__(self):
-        return (
-            f"{self.__class__.__name__}(left={self.left}, top={self.top}, right={self.right}, "
-            f"bottom={self.bottom})"
-        )
+    Without a signature ctypes has to work out how to convert every argument on each call and it
+    truncates returned handles to an int.
 
-    @property
-    def width(self) -> float:
-        """float : Width of the rectangle"""
-        return self.right - self.left
+    Parameters
+    ----------
+    function : ctypes._FuncPtr
+        The function to declare
+    restype : type
+        The ctypes type the function returns
+    *argtypes : type
+        The ctypes types of the function's arguments
+    """
+    function.restype = restype
+    function.argtypes = argtypes
+
+
+declare(user32.SetProcessDPIAware, ctypes.wintypes.BOOL)
+declare(user32.EnumWindows, ctypes.wintypes.BOOL, WNDENUMPROC, ctypes.wintypes.LPARAM)
+declare(user32.IsWindowVisible, ctypes.wintypes.BOOL, ctypes.wintypes.HWND)
+declare(user32.IsIconic, ctypes.wintypes.BOOL, ctypes.wintypes.HWND)
+declare(user32.IsZoomed, ctypes.wintypes.BOOL, ctypes.wintypes.HWND)
+declare(user32.GetWindowLongW, ctypes.wintypes.LONG, ctypes.wintypes.HWND, ctypes.c_int)
+declare(user32.GetWindowTextLengthW, ctypes.c_int, ctypes.wintypes.HWND)
+declare(
+    user32.GetWindowTextW, ctypes.c_int, ctypes.wintypes.HWND, ctypes.wintypes.LPWSTR, ctypes.c_int
+)
+declare(
+    user32.GetWindowThreadProcessId,
+    ctypes.wintypes.DWORD,
+    ctypes.wintypes.HWND,
+    ctypes.wintypes.LPDWORD,
+)
+declare(user32.GetWindowRect, ctypes.wintypes.BOOL, ctypes.wintypes.HWND, ctypes.wintypes.LPRECT)
+declare(user32.ShowWindow, ctypes.wintypes.BOOL, ctypes.wintypes.HWND, ctypes.c_int)
+declare(user32.GetDpiForWindow, ctypes.wintypes.UINT, ctypes.wintypes.HWND)
+declare(
+    user32.SetWindowPos,
+    ctypes.wintypes.BOOL,
+    ctypes.wintypes.HWND,
+    ctypes.wintypes.HWND,
+    ctypes.c_int,
+    ctypes.c_int,
+    ctypes.c_int,
+    ctypes.c_int,
+    ctypes.wintypes.UINT,
+)
+# HDWP is a handle so it must not be truncated to an int
+declare(user32.BeginDeferWindowPos, ctypes.wintypes.HANDLE, ctypes.c_int)
+declare(
+    user32.DeferWindowPos,
+    ctypes.wintypes.HANDLE,
+    ctypes.wintypes.HANDLE,
+    ctypes.wintypes.HWND,
+    ctypes.wintypes.HWND,
+    ctypes.c_int,
+    ctypes.c_int,
+    ctypes.c_int,
+    ctypes.c_int,
+    ctypes.wintypes.UINT,
+)
+declare(user32.EndDeferWindowPos, ctypes.wintypes.BOOL, ctypes.wintypes.HANDLE)
+declare(
+    dwmapi.DwmGetWindowAttribute,
+    ctypes.c_long,
+    ctypes.wintypes.HWND,
+    ctypes.wintypes.DWORD,
+    ctypes.c_void_p,
+    ctypes.wintypes.DWORD,
+)
+declare(
+    kernel32.OpenProcess,
+    ctypes.wintypes.HANDLE,
+    ctypes.wintypes.DWORD,
+    ctypes.wintypes.BOOL,
+    ctypes.wintypes.DWORD,
+)
+declare(
+    kernel32.QueryFullProcessImageNameW,
+    ctypes.wintypes.BOOL,
+    ctypes.wintypes.HANDLE,
+    ctypes.wintypes.DWORD,
+    ctypes.wintypes.LPWSTR,
+    ctypes.wintypes.PDWORD,
+)
+declare(kernel32.CloseHandle, ctypes.wintypes.BOOL, ctypes.wintypes.HANDLE)
+declare(shcore.SetProcessDpiAwareness, ctypes.c_long, ctypes.c_int)
+
+# Monitor and window coordinates are only exact on every monitor when the process is per monitor
+# DPI aware, otherwise Windows scales them for monitors with a different scaling. Fall back to
+# system DPI awareness if per monitor awareness isn't available.
+if shcore.SetProcessDpiAwareness(PROCESS_PER_MONITOR_DPI_AWARE) != 0:
+    user32.SetProcessDPIAware()
+
+
+def log_debug(message: str, *args) -> None:
+    """Log a debug message when running with ``--debug``
 
-    @property
-    def height(self) -> float:
-        """float : Height of the rectangle"""
-        return self.bottom - self.top
+    Parameters
+    ----------
+    message : str
+        The message, formatted with ``%`` and ``args`` only when it is logged
+    *args
+        Values to format into the message
+    """
+    if DEBUG:
+        dpg_core.log_debug(message % args if args else message)
+
+
+def log_info(message: str, *args) -> None:
+    """Log an info message when running with ``--debug``
+
+    Parameters
+    ----------
+    message : str
+        The message, formatted with ``%`` and ``args`` only when it is logged
+    *args
+        Values to format into the message
+    """
+    if DEBUG:
+        dpg_core.log_info(message % args if args else message)
 
 
-class Rectangle(RectangleMixin):
+class Rectangle(NamedTuple):
     """Represents a rectangle
 
+    Use ``Rectangle.from_edges`` when the edges may not be in order.
+
     Parameters
     ----------
     left : float
@@ -67,48 +187,41 @@ class Rectangle(RectangleMixin):
         Coordinate of the bottom side of the rectangle
     """
 
-    def __init__(self, left, right, top, bottom) -> None:
-        left, right, top, bottom = float(left), float(right), float(top), float(bottom)
-        if left > right:
-            left, right = right, left
-        if top > bottom:
-            top, bottom = bottom, top
-        self._left = left
-        self._right = right
-        self._top = top
-        self._bottom = bottom
-
-    def __getitem__(self, index) -> float:
-        if index == 0:
-            return self.left
-        elif index == 1:
-            return self.right
-        elif index == 2:
-            return self.top
-        elif index == 3:
-            return self.bottom
-        else:
-            raise IndexError(f"{index} is not in alllowed range of 0-3")
+    left: float
+    right: float
+    top: float
+    bottom: float
 
-    @property
-    def left(self) -> float:
-        """float : left coordinate of the rectangle"""
-        return self._left
+    @classmethod
+    def from_edges(cls, left, right, top, bottom) -> Rectangle:
+        """Create a rectangle from its edges
 
-    @property
-    def right(self) -> float:
-        """float : right coordinate of the rectangle"""
-        return self._right
+        The edges are swapped if needed so left is less than right and top is less than bottom.
+
+        Parameters
+        ----------
+        left : float
+            Coordinate of the left side of the rectangle
+        right : float
+            Coordinate of the right side of the rectangle
+        top : float
+            Coordinate of the top side of the rectangle
+        bottom : float
+            Coordinate of the bottom side of the rectangle
+        """
+        left, right = (float(left), float(right)) if left <= right else (float(right), float(left))
+        top, bottom = (float(top), float(bottom)) if top <= bottom else (float(bottom), float(top))
+        return cls(left, right, top, bottom)
 
     @property
-    def top(self) -> float:
-        """float : top coordinate of the rectangle"""
-        return self._top
+    def width(self) -> float:
+        """float : Width of the rectangle"""
+        return self.right - self.left
 
     @property
-    def bottom(self) -> float:
-        """float : bottom coordinate of the rectangle"""
-        return self._bottom
+    def height(self) -> float:
+        """float : Height of the rectangle"""
+        return self.bottom - self.top
 
 
 @dataclass(frozen=True)
@@ -157,8 +270,8 @@ class Monitor:
         area_left, area_top, area_right, area_bottom = info["Monitor"]
         work_left, work_top, work_right, work_bottom = info["Work"]
         return cls(
-            area=Rectangle(area_left, area_right, area_top, area_bottom),
-            work=Rectangle(work_left, work_right, work_top, work_bottom),
+            area=Rectangle.from_edges(area_left, area_right, area_top, area_bottom),
+            work=Rectangle.from_edges(work_left, work_right, work_top, work_bottom),
             is_primary=info["Flags"] == 1,
             name=info["Device"].lstrip("\\\\.\\"),
             id=device.DeviceID,
@@ -168,7 +281,45 @@ class Monitor:
         return f"{self.__class__.__name__}({self.name})"
 
     def __hash__(self):
-        return self.id
+        return hash(self.id)
+
+
+def dump_json(obj) -> bytes:
+    """Serialize an object to compact JSON
+
+    orjson is used when it is installed as it is much faster than the standard library.
+
+    Parameters
+    ----------
+    obj : Any
+        The object to serialize
+
+    Returns
+    -------
+    data : bytes
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def load_json(data: bytes):
+    """Deserialize JSON created by :func:`dump_json`
+
+    Parameters
+    ----------
+    data : bytes
+        UTF-8 encoded JSON
+
+    Returns
+    -------
+    obj : Any
+        The deserialized object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 def get_monitors() -> list[Monitor]:
@@ -185,52 +336,190 @@ def get_monitors() -> list[Monitor]:
     return monitors
 
 
-def get_windows() -> dict[str, UIAWrapper]:
+@dataclass(frozen=True)
+class Window:
+    """A top level window
+
+    Parameters
+    ----------
+    handle : int
+        The window's handle
+    process_id : int
+        ID of the process that owns the window
+    text : str
+        The window's title
+    """
+
+    handle: int
+    process_id: int
+    text: str
+
+
+_cloaked = ctypes.wintypes.DWORD()
+
+
+def is_cloaked(handle: int) -> bool:
+    """Check if a window is cloaked
+
+    The desktop window manager can hide a window without making it invisible, for example a
+    suspended UWP app or a window on another virtual desktop.
+
+    Parameters
+    ----------
+    handle : int
+        The window's handle
+
+    Returns
+    -------
+    cloaked : bool
+        Whether the window is cloaked
+    """
+    result = dwmapi.DwmGetWindowAttribute(
+        handle, DWMWA_CLOAKED, ctypes.byref(_cloaked), ctypes.sizeof(_cloaked)
+    )
+    return result == 0 and bool(_cloaked.value)
+
+
+def enum_windows() -> list[Window]:
+    """Get the shown top level windows that have a title and are not tool windows
+
+    These are the windows a user can see and snap. Only the handle, title and process id of each
+    window are read.
+
+    Returns
+    -------
+    windows : list[Window]
+        The visible top level windows
+
+    Notes
+    -----
+    See https://docs.microsoft.com/en-us/windows/win32/api/winuser/nf-winuser-enumwindows for more
+    information.
+    """
+    windows = []
+
+    def callback(handle, lparam):
+        # Tool windows (i.e. floating toolbars) don't show in the task bar and aren't meant to be
+        # moved on their own. Cloaked windows (i.e. suspended UWP apps) count as visible but are
+        # not shown on the screen.
+        if (
+            user32.IsWindowVisible(handle)
+            and not user32.GetWindowLongW(handle, win32con.GWL_EXSTYLE) & win32con.WS_EX_TOOLWINDOW
+            and not is_cloaked(handle)
+        ):
+            length = user32.GetWindowTextLengthW(handle)
+            if length:
+                text = ctypes.create_unicode_buffer(length + 1)
+                user32.GetWindowTextW(handle, text, length + 1)
+                pid = ctypes.wintypes.DWORD()
+                user32.GetWindowThreadProcessId(handle, ctypes.byref(pid))
+                windows.append(Window(handle, pid.value, text.value))
+        # Continue enumerating
+        return True
+
+    user32.EnumWindows(WNDENUMPROC(callback), 0)
+    return windows
+
+
+def get_process_names(pids: set[int]) -> dict[int, str]:
+    """Get the executable name of each process
+
+    The application of a window is named after its executable, as the window text changes with
+    the state of the application. Each process is queried once, however many windows it has.
+
+    Parameters
+    ----------
+    pids : set[int]
+        IDs of the processes to get the names of
+
+    Returns
+    -------
+    process_names : dict[int, str]
+        Map process ids to the name of the process's executable (i.e. explorer.exe). Processes
+        that could not be queried are left out.
+
+    Notes
+    -----
+    See
+    https://docs.microsoft.com/en-us/windows/win32/api/winbase/nf-winbase-queryfullprocessimagenamew
+    for more information.
+    """
+    process_names = {}
+    path = ctypes.create_unicode_buffer(1024)
+    for pid in pids:
+        handle = kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+        # The process may have closed or be protected
+        if not handle:
+            continue
+        try:
+            length = ctypes.wintypes.DWORD(len(path))
+            if kernel32.QueryFullProcessImageNameW(handle, 0, path, ctypes.byref(length)):
+                process_names[pid] = os.path.basename(path.value)
+        finally:
+            kernel32.CloseHandle(handle)
+    return process_names
+
+
+def get_windows(top_level_windows: list[Window] = None) -> dict[str, int]:
     """Get the current running applications with visible windows
 
+    Parameters
+    ----------
+    top_level_windows : list[Window]
+        The windows from ``enum_windows``, enumerated if not given
+
     Returns
     -------
-    windows : dict[str, UIAWrapper]
-        Map names of applications to a uiawrapper object of the window
+    windows : dict[str, int]
+        Map names of applications to the handle of the application's window
     """
     windows = {}
-    apps = collections.defaultdict(list)
-    handles_to_windows = {}
-    window: UIAWrapper
-
-    # For each application with a moveable window, we need to map each application name to a PID.
-    # Multiple handles with the same application name (i.e. two running instances of explorer) is
-    # expected. We handle this by first creating a list of windows of the same application name and
-    # then we enumerate the application names so they are unique. We use the handles to keep the
-    # windows sorted in the same order on every call.
-
-    for window in Desktop(backend="uia").windows():
-        text = window.window_text()
-        # Only use applications that have window text and are not Program Manager or Task Bar. Those
-        # applications always appear but cannot be moved.
-        if text and text not in {"Program Manager", "Taskbar"}:
-            # Get the application name from the pid rather than the window text. The window text can
-            # changes by the state of the application. For example, explorer's window text is based
-            # on the current folder - however we want to get explorer.exe
-            pid = window.process_id()
-            app = psutil.Process(window.process_id()).name()
-            apps[app].append(window.handle)
-            handles_to_windows[window.handle] = window
-
-    for app, handles in apps.items():
-        handles = sorted(handles)
-        if len(handles) == 1:
-            windows[app] = handles_to_windows[handles[0]]
+    app_windows = []
+
+    # For each application with a moveable window, we need to map each application name to a
+    # window. Multiple windows with the same application name (i.e. two running instances of
+    # explorer) is expected. We handle this by counting the windows of each application and then we
+    # enumerate the application names of those with more than one window so they are unique. We
+    # sort the windows by handle to keep them in the same order on every call.
+
+    if top_level_windows is None:
+        top_level_windows = enum_windows()
+
+    # Only use applications that are not Program Manager or Task Bar. Those applications always
+    # appear but cannot be moved.
+    top_level_windows = [
+        window for window in top_level_windows if window.text not in {"Program Manager", "Taskbar"}
+    ]
+    # Get the application name from the pid rather than the window text. The window text can
+    # changes by the state of the application. For example, explorer's window text is based on the
+    # current folder - however we want to get explorer.exe
+    process_names = get_process_names({window.process_id for window in top_level_windows})
+
+    for window in sorted(top_level_windows, key=lambda window: window.handle):
+        app = process_names.get(window.process_id, window.text)
+        app_windows.append((app, window.handle))
+
+    counts = collections.Counter(app for app, _ in app_windows)
+    numbers = collections.Counter()
+    for app, handle in app_windows:
+        if counts[app] == 1:
+            windows[app] = handle
         else:
-            for n, pid in enumerate(handles):
-                name = f"{app} - {n + 1}"
-                windows[name] = handles_to_windows[pid]
+            numbers[app] += 1
+            windows[f"{app} - {numbers[app]}"] = handle
 
-    dpg_core.log_debug(f"windows: {windows}")
+    log_debug("windows: %s", windows)
 
     return windows
 
 
+# Reused for every window rather than creating new rects on each call
+_frame_rect = ctypes.wintypes.RECT()
+_window_rect = ctypes.wintypes.RECT()
+# Map window handles to the window's style and DPI and the borders measured with them
+_border_cache: dict[int, tuple[tuple[int, int], tuple[int, int, int, int]]] = {}
+
+
 def get_window_borders(handle: int) -> tuple[float, float, float, float]:
     """Get the borders for the given window
 
@@ -240,51 +529,148 @@ def get_window_borders(handle: int) -> tuple[float, float, float, float]:
     stackoverflow
     https://stackoverflow.com/questions/34139450/getwindowrect-returns-a-size-including-invisible-borders
     answer for more details.
+
+    The borders only change with the window's style and the DPI of the monitor it is on so they
+    are cached until either changes.
     """
-    rect = ctypes.wintypes.RECT()
-    windowrect = ctypes.wintypes.RECT()
-    handle = ctypes.wintypes.HWND(handle)
-    dwmapi.DwmGetWindowAttribute(
-        handle, DWORD_DWMWA_EXTENDED_FRAME_BOUNDS, ctypes.byref(rect), ctypes.sizeof(rect)
-    )
+    key = (user32.GetWindowLongW(handle, win32con.GWL_STYLE), user32.GetDpiForWindow(handle))
+    cached = _border_cache.get(handle)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    rect, windowrect = _frame_rect, _window_rect
+    dwmapi.DwmGetWindowAttribute(handle, DWMWA_EXTENDED_FRAME_BOUNDS, ctypes.byref(rect), RECT_SIZE)
     user32.GetWindowRect(handle, ctypes.byref(windowrect))
-    return (
+    borders = (
         abs(windowrect.left - rect.left),
         abs(windowrect.right - rect.right),
         abs(windowrect.top - rect.top),
         abs(windowrect.bottom - rect.bottom),
     )
+    _border_cache[handle] = (key, borders)
+    return borders
+
+
+def set_window_positions(positions: list[tuple[int, int, int, int, int]], flags: int) -> None:
+    """Set the position of several windows at once
+
+    The windows are moved together with ``DeferWindowPos`` so the window manager updates the screen
+    once for all of them.
+
+    Parameters
+    ----------
+    positions : list[tuple[int, int, int, int, int]]
+        The handle, x, y, width and height of each window
+    flags : int
+        ``SetWindowPos`` flags used for every window
+    """
+    hdwp = user32.BeginDeferWindowPos(len(positions))
+    for handle, x, y, width, height in positions:
+        if not hdwp:
+            break
+        hdwp = user32.DeferWindowPos(hdwp, handle, None, x, y, width, height, flags)
+
+    if hdwp:
+        user32.EndDeferWindowPos(hdwp)
+    else:
+        # If any window can't be deferred the whole batch is discarded so move them one by one
+        for handle, x, y, width, height in positions:
+            user32.SetWindowPos(handle, None, x, y, width, height, flags)
 
 
-def move_window(handle: int, x: int, y: int, width: int, height: int) -> None:
-    """Move a window to a given position and size
+def move_windows(moves: list[tuple[int, int, int, int, int]]) -> None:
+    """Move windows to given positions and sizes
 
     Unfortunately you can't just call ``user32.MoveWindow`` to move the window exactly where you
     want it. First, you have restore the window as moving windows that are maximized will not move.
     Next, get the the window borders to account for invisible pixels around the window. Last, we
-    move and resize the windows.
+    move and resize the windows. Windows whose visible frame is already in place are left alone so
+    snapping twice doesn't redraw anything.
+
+    Parameters
+    ----------
+    moves : list[tuple[int, int, int, int, int]]
+        The handle, x, y, width and height to move each window to
     """
-    left_border, right_border, top_border, bottom_border = get_window_borders(handle)
+    positions = []
+    frame = _frame_rect
+    for handle, x, y, width, height in moves:
+        handle, x, y, width, height = int(handle), int(x), int(y), int(width), int(height)
+        # Compare the visible frame measured now rather than going through the cached borders so
+        # a window placed with out of date borders is still moved
+        if not (user32.IsZoomed(handle) or user32.IsIconic(handle)):
+            result = dwmapi.DwmGetWindowAttribute(
+                handle, DWMWA_EXTENDED_FRAME_BOUNDS, ctypes.byref(frame), RECT_SIZE
+            )
+            current = (frame.left, frame.top, frame.right, frame.bottom)
+            if result == 0 and current == (x, y, x + width, y + height):
+                continue
+        left_border, right_border, top_border, bottom_border = get_window_borders(handle)
+        user32.ShowWindow(handle, SW_RESTORE)
+        positions.append(
+            (
+                handle,
+                x - left_border,
+                y - top_border,
+                width + left_border + right_border,
+                height + top_border + bottom_border,
+            )
+        )
 
-    handle = ctypes.wintypes.HWND(int(handle))
-    user32.ShowWindow(handle, win32con.SW_RESTORE)
+    if not positions:
+        return
 
-    x, y, height, width = int(x), int(y), int(height), int(width)
     # We can't move and resize the window at the same time. This is probably a bug in the windows
     # API but moving and then resizing seems to be a good work around.
-    move_flags = win32con.SWP_NOZORDER | win32con.SWP_NOACTIVATE | win32con.SWP_NOSIZE
-    user32.SetWindowPos(handle, None, x - left_border, y - top_border, 0, 0, move_flags)
-
-    size_flags = win32con.SWP_NOZORDER | win32con.SWP_NOACTIVATE | win32con.SWP_NOMOVE
-    user32.SetWindowPos(
-        handle,
-        None,
-        0,
-        0,
-        width + left_border + right_border,
-        height + top_border + bottom_border,
-        size_flags,
-    )
+    set_window_positions(positions, SWP_MOVE_FLAGS)
+    set_window_positions(positions, SWP_SIZE_FLAGS)
+
+
+def get_grid_axis(
+    start: float, stop: float, line_values: list[float]
+) -> tuple[list[float], list[float], list[float]]:
+    """Get the geometry of the grids along one axis
+
+    Parameters
+    ----------
+    start : float
+        Coordinate where the first grid starts
+    stop : float
+        Coordinate where the last grid stops
+    line_values : list[float]
+        Sorted coordinates of the lines between the grids
+
+    Returns
+    -------
+    edges : list[float]
+        Coordinates of the edges of the grids, including start and stop
+    centers : list[float]
+        Coordinate of the center point of each grid
+    percents : list[float]
+        Percent of the distance between start and stop each grid consumes
+    """
+    edges = [start, *line_values, stop]
+    scale = 100 / (stop - start)
+    centers = [(edge0 + edge1) * 0.5 for edge0, edge1 in zip(edges, edges[1:])]
+    percents = [(edge1 - edge0) * scale for edge0, edge1 in zip(edges, edges[1:])]
+    return edges, centers, percents
+
+
+_widget_ids = itertools.count(1)
+
+
+def new_widget_id() -> str:
+    """Create an id for a widget that is unique within this process
+
+    The ids only have to be unique while the app is running so a counter is used rather than a
+    ``uuid4``, which also keeps the ids and the labels made from them short.
+
+    Returns
+    -------
+    widget_id : str
+        Unique widget id
+    """
+    return f"w{next(_widget_ids):x}"
 
 
 class UniqueContainer:
@@ -301,7 +687,7 @@ class UniqueContainer:
 
     def __init__(self, parent: str = None) -> None:
         self._parent = parent
-        self._id = str(uuid4())
+        self._id = new_widget_id()
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}({self.id})"
@@ -353,6 +739,9 @@ class AppTable(UniqueContainer):
         self._allocated_windows = set()
         self._available_windows = []
         self._grid_mapping = defaultdict(list)
+        # Map each row to the windows and selected windows currently shown in its table
+        self._rendered_rows: dict[int, tuple[tuple[str, ...], frozenset[str]]] = {}
+        self._row_ids: dict[int, dict[str, str]] = {}
         self._nrows = 0
 
     @property
@@ -360,6 +749,32 @@ class AppTable(UniqueContainer):
         """set : windows that have already been selected"""
         return self._allocated_windows.copy()
 
+    def row_ids(self, row: int) -> dict[str, str]:
+        """Get the ids of the widgets in a row
+
+        The ids never change for a row so they are only created once.
+
+        Parameters
+        ----------
+        row : int
+            The row number
+
+        Returns
+        -------
+        ids : dict[str, str]
+            Map the widget in the row to its id
+        """
+        ids = self._row_ids.get(row)
+        if ids is None:
+            ids = self._row_ids[row] = {
+                "row": f"{self._id}_{row}",
+                "number": f"##{self._id}_{row}_number",
+                "header": f"##{self._id}_{row}_header",
+                "table": f"{self._id}_{row}_table",
+                "sep": f"{self._id}_{row}_sep",
+            }
+        return ids
+
     def init_ui(self):
         """Initialize the container's UI"""
         with dpg_simple.managed_columns(f"{self._id}_head", len(self.HEADER), parent=self.parent):
@@ -369,8 +784,8 @@ class AppTable(UniqueContainer):
     def clear(self):
         """Clear the table of all rows"""
         for row in reversed(range(1, self._nrows + 1)):
-            label = f"{self._id}_{row}"
-            dpg_core.delete_item(label)
+            dpg_core.delete_item(self.row_ids(row)["row"])
+        self._rendered_rows.clear()
         self._nrows = 0
 
     def selected(self, sender, data):
@@ -383,9 +798,7 @@ class AppTable(UniqueContainer):
 
         number = int(sender.split("_")[1])
         self._grid_mapping[number] = selected_items
-        self._allocated_windows = set(
-            reduce(lambda s1, s2: set(s1) | set(s2), self._grid_mapping.values())
-        )
+        self._allocated_windows = set().union(*self._grid_mapping.values())
         self.refresh_available_windows()
 
     def refresh_available_windows(self, *args, **kwargs):
@@ -393,25 +806,38 @@ class AppTable(UniqueContainer):
 
         After an app is selected, other grids should not be able to select it as well.
         """
-        dpg_core.log_debug(f"Refreshing available windows for table {self.id}")
-        active_windows = set(self.ACTIVE_WINDOWS)
-        available_windows = active_windows - self._allocated_windows
+        log_debug("Refreshing available windows for table %s", self.id)
+        # The active and allocated windows are the same for every row so sort the active windows
+        # once and filter them for each row, which keeps each row's windows in sorted order.
+        active_windows = sorted(self.ACTIVE_WINDOWS)
+        allocated_windows = self._allocated_windows
         grid_mapping = defaultdict(list)
         for row in range(1, self._nrows + 1):
-            dpg_core.clear_table(f"{self._id}_{row}_table")
+            selected_windows = frozenset(self._grid_mapping[row])
+            windows = tuple(
+                name
+                for name in active_windows
+                if name not in allocated_windows or name in selected_windows
+            )
+            selected_active_windows = [name for name in windows if name in selected_windows]
+            grid_mapping[row] = selected_active_windows
 
-            selected_active_windows = set(self._grid_mapping[row]) & active_windows
-            grid_mapping[row] = list(selected_active_windows)
+            # Only rebuild the table if what it shows has changed
+            rendered = (windows, frozenset(selected_active_windows))
+            if self._rendered_rows.get(row) == rendered:
+                continue
+            self._rendered_rows[row] = rendered
 
-            windows = sorted(list(available_windows | selected_active_windows))
+            table = self.row_ids(row)["table"]
+            # Clearing also removes the old selections
+            dpg_core.clear_table(table)
+            dpg_core.set_table_data(table, [[name] for name in windows])
             for n, name in enumerate(windows):
-                dpg_core.add_row(f"{self._id}_{row}_table", [name])
-
-                if name in selected_active_windows:
-                    dpg_core.set_table_selection(f"{self._id}_{row}_table", n, 0, True)
+                if name in selected_windows:
+                    dpg_core.set_table_selection(table, n, 0, True)
 
         self._grid_mapping = grid_mapping
-        dpg_core.log_debug(f"Refreshed available windows for table {self.id}")
+        log_debug("Refreshed available windows for table %s", self.id)
 
     def set_rows(self, nrows):
         """ "Set the rows in the table
@@ -419,9 +845,10 @@ class AppTable(UniqueContainer):
         Each row has two columns. The first column is the grid number. The second column is a list
         of applications to snap to the grid. We use a table to enable multiselect
         """
-        dpg_core.log_info(f"Refreshing rows for table {self.id}")
+        log_info("Refreshing rows for table %s", self.id)
         for row in range(1, nrows + 1):
-            name = f"{self._id}_{row}"
+            ids = self.row_ids(row)
+            name = ids["row"]
             # If the row already exists, we don't need to do anything else
             if dpg_core.does_item_exist(name):
                 continue
@@ -429,7 +856,7 @@ class AppTable(UniqueContainer):
             with dpg_simple.managed_columns(name, len(self.HEADER), parent=self.parent):
                 # The first column is the grid number
                 dpg_core.add_input_int(
-                    f"##{self._id}_{row}_number",
+                    ids["number"],
                     default_value=row,
                     readonly=True,
                     step=0,
@@ -438,22 +865,23 @@ class AppTable(UniqueContainer):
 
                 # The second column is the table. Wrap in a collapsing header so the screen isn't
                 # too full the entire time.
-                with dpg_simple.collapsing_header(f"##{self._id}_{row}_header", parent=name):
+                with dpg_simple.collapsing_header(ids["header"], parent=name):
                     dpg_core.add_table(
-                        f"{self._id}_{row}_table",
+                        ids["table"],
                         [""],  # no headers
                         callback=self.selected,
-                        parent=f"##{self._id}_{row}_header",
+                        parent=ids["header"],
                     )
                     # populate the table with the names of available windows
-                    for window_name in sorted(self.ACTIVE_WINDOWS):
-                        dpg_core.add_row(f"{self._id}_{row}_table", [window_name])
+                    window_names = tuple(sorted(self.ACTIVE_WINDOWS))
+                    dpg_core.set_table_data(ids["table"], [[name] for name in window_names])
+                    self._rendered_rows[row] = (window_names, frozenset())
 
             # Separate each row with a line
-            dpg_core.add_separator(name=f"{self._id}_{row}_sep", parent=name)
+            dpg_core.add_separator(name=ids["sep"], parent=name)
 
         self._nrows = nrows
-        dpg_core.log_info(f"Refreshed rows for table {self.id}")
+        log_info("Refreshed rows for table %s", self.id)
 
 
 class MonitorProfile(UniqueContainer):
@@ -474,12 +902,22 @@ class MonitorProfile(UniqueContainer):
     def __init__(self, parent: str, monitor: Monitor) -> None:
         super().__init__(parent=parent)
         self._monitor = monitor
-        self._ylines = []
-        self._xlines = []
-        self._labels = []
-        self._rectangle_mapping = {}
-        self._left_panel_id = str(uuid4())
-        self._right_panel_id = str(uuid4())
+        # Map the name of each line to its position. The positions are kept here so they don't
+        # have to be read back from the plot.
+        self._ylines: dict[str, int] = {}
+        self._xlines: dict[str, int] = {}
+        # The line positions in sorted order, kept sorted as the lines move
+        self._yline_values: list[int] = []
+        self._xline_values: list[int] = []
+        # Map the tag of each annotation in the plot to the arguments it was added with
+        self._labels: dict[str, tuple] = {}
+        # The edges of the grids and the rectangles made from them. The rectangles are only
+        # created when they're needed.
+        self._x_edges = []
+        self._y_edges = []
+        self._rectangle_mapping = None
+        self._left_panel_id = new_widget_id()
+        self._right_panel_id = new_widget_id()
         self._input_id = self.create_label("", "input")
         self._snap_id = self.create_label("Snap", "snap")
         self._plot_id = self.create_label("", "plot")
@@ -500,76 +938,78 @@ class MonitorProfile(UniqueContainer):
         """AppTable : The application table to select apps to snap to grids"""
         return self._app_table
 
+    @property
+    def rectangle_mapping(self) -> dict[int, Rectangle]:
+        """dict[int, Rectangle] : Map each grid number to the grid's rectangle
+
+        These rectangles will be used to snap the window into place. They are created from the
+        current grid edges the first time they are needed after the grid changes, rather than every
+        time a line is dragged.
+        """
+        if self._rectangle_mapping is None:
+            rectangle_mapping = {}
+            grid = 1
+            for x0, x1 in zip(self._x_edges, self._x_edges[1:]):
+                for y0, y1 in zip(self._y_edges, self._y_edges[1:]):
+                    rectangle_mapping[grid] = Rectangle.from_edges(x0, x1, y0, y1)
+                    grid += 1
+            self._rectangle_mapping = rectangle_mapping
+        return self._rectangle_mapping
+
     def set_labels(self):
         """Label each grid in the plot
 
         Grids are labeled in increasing order from left to right then top to bottom. Include below
         the label the percent amount each grid takes up width and height wise.
         """
-        # First remove all the labels from the plot
-        for label in self._labels:
-            dpg_core.delete_annotation(self._plot_id, label)
-            dpg_core.delete_annotation(self._plot_id, f"{label}%")
-
-        x0 = self.monitor.work.left
-        xs = []
-        x_percents = []
-        xline_values = sorted([dpg_core.get_value(xline) for xline in self._xlines])
-        for x1 in itertools.chain(xline_values, [self.monitor.work.right]):
-            # Get the x coordinate of the center point of the grid
-            xs.append(((x0 + x1) / 2))
-            # Get the percent of the width this x grid consumes
-            x_percents.append(((x1 - x0) / self.monitor.work.width) * 100)
-            x0 = x1
-
-        ys = []
-        y_percents = []
-        y0 = self.monitor.work.top
-        yline_values = sorted([dpg_core.get_value(yline) for yline in self._ylines])
-        for y1 in itertools.chain(yline_values, [self.monitor.work.bottom]):
-            ys.append(((y0 + y1) / 2))
-            y_percents.append(((y1 - y0) / self.monitor.work.height) * 100)
-            y0 = y1
+        # The edges of the grids are used for both the labels and the rectangles
+        work = self.monitor.work
+        x_edges, xs, x_percents = get_grid_axis(work.left, work.right, self._xline_values)
+        y_edges, ys, y_percents = get_grid_axis(work.top, work.bottom, self._yline_values)
 
         # Place each grids label in the center of each grid.
         number = 1
-        labels = []
+        labels = {}
         for y, y_percent in zip(reversed(ys), y_percents):
             for x, x_percent in zip(xs, x_percents):
-                tag = str(uuid4())
-                dpg_core.add_annotation(self._plot_id, str(number), x, y, 0, 0, tag=tag)
-                dpg_core.add_annotation(
-                    self._plot_id, f"{x_percent:.2f}x{y_percent:.2f}", x, y, 0, 2, tag=f"{tag}%"
-                )
-                labels.append(tag)
+                tag = f"label{number}-{self.id}"
+                labels[tag] = (str(number), x, y, 0, 0)
+                labels[f"{tag}%"] = (f"{x_percent:.2f}x{y_percent:.2f}", x, y, 0, 2)
                 number += 1
+
+        # Annotations can't be moved, they have to be removed and added again. Dragging a line only
+        # changes the grids next to it so only replace the labels that changed.
+        for tag, label in self._labels.items():
+            if labels.get(tag) != label:
+                dpg_core.delete_annotation(self._plot_id, tag)
+        for tag, label in labels.items():
+            if self._labels.get(tag) != label:
+                dpg_core.add_annotation(self._plot_id, *label, tag=tag)
         self._labels = labels
 
-        # Map each grid number to the grids rectangle. These rectangles will be used to snap the
-        # window into place
-        self._rectangle_mapping.clear()
-        y_edges = [self.monitor.work.top] + yline_values + [self.monitor.work.bottom]
-        x_edges = [self.monitor.work.left] + xline_values + [self.monitor.work.right]
-        grid = 1
-        for x_index in range(len(x_edges) - 1):
-            x0, x1 = x_edges[x_index], x_edges[x_index + 1]
-            for y_index in range(len(y_edges) - 1):
-                y0, y1 = y_edges[y_index], y_edges[y_index + 1]
-                self._rectangle_mapping[grid] = Rectangle(x0, x1, y0, y1)
-                grid += 1
+        # The grids changed so the rectangles have to be created again
+        self._x_edges = x_edges
+        self._y_edges = y_edges
+        self._rectangle_mapping = None
 
     def line_callback(self, sender, data):
         """Whenever a line is moved, reset the labels"""
         # Since the windows can only be snapped to integer positions, ensure the grid lines are
         # always at integer values
-        dpg_core.set_value(sender, int(dpg_core.get_value(sender)))
+        value = int(dpg_core.get_value(sender))
+        dpg_core.set_value(sender, value)
+        if sender in self._xlines:
+            lines, values = self._xlines, self._xline_values
+        else:
+            lines, values = self._ylines, self._yline_values
+        values.remove(lines[sender])
+        bisect.insort(values, value)
+        lines[sender] = value
         self.set_labels()
 
     def input_callback(self, sender, data):
         """Callback when the input grids are changed"""
-        dpg_core.log_info(
-            f"Refreshing grid for monitor profile {self.monitor.name} as input changed"
-        )
+        log_info("Refreshing grid for monitor profile %s as input changed", self.monitor.name)
         # First remove each line from the plot
         for xline in self._xlines:
             dpg_core.delete_drag_line(self._plot_id, xline)
@@ -583,7 +1023,7 @@ class MonitorProfile(UniqueContainer):
         dpg_core.set_value(self._input_id, [rows, cols])
 
         # Add horizontal lines to the plot
-        ylines = []
+        ylines = {}
         for row in range(1, rows):
             name = f"yline{row}-{self.id}"
             pos = int(self.monitor.work.top + (row / rows) * self.monitor.work.height)
@@ -595,10 +1035,10 @@ class MonitorProfile(UniqueContainer):
                 default_value=pos,
                 callback=self.line_callback,
             )
-            ylines.append(name)
+            ylines[name] = pos
 
         # Add vertical lines to the plot
-        xlines = []
+        xlines = {}
         for col in range(1, cols):
             name = f"xline{col}-{self.id}"
             pos = int(self.monitor.work.left + (col / cols) * self.monitor.work.width)
@@ -610,33 +1050,35 @@ class MonitorProfile(UniqueContainer):
                 default_value=pos,
                 callback=self.line_callback,
             )
-            xlines.append(name)
+            xlines[name] = pos
 
         self._xlines = xlines
         self._ylines = ylines
+        self._xline_values = sorted(xlines.values())
+        self._yline_values = sorted(ylines.values())
 
         # Reset the labels and application table to reflect the new grids
         self.set_labels()
         self._app_table.clear()
         self._app_table.set_rows(rows * cols)
-        dpg_core.log_info(
-            f"Refreshed grid for monitor profile {self.monitor.name} as input changed"
-        )
+        log_info("Refreshed grid for monitor profile %s as input changed", self.monitor.name)
 
     def snap(self, sender, data):
         """Snap each window to the selected grid"""
-        dpg_core.log_info(f"Snapping windows in monitor profile {self.monitor.name}")
+        log_info("Snapping windows in monitor profile %s", self.monitor.name)
+        moves = []
         for number, windows in self._app_table._grid_mapping.items():
-            if number not in self._rectangle_mapping:
+            if number not in self.rectangle_mapping:
                 continue
-            rect = self._rectangle_mapping[number]
+            rect = self.rectangle_mapping[number]
             for name in windows:
-                window = AppTable.ACTIVE_WINDOWS[name]
-                dpg_core.log_debug(f"Snapping window {window}")
-                move_window(
-                    window.handle, int(rect.left), int(rect.top), int(rect.width), int(rect.height)
+                handle = AppTable.ACTIVE_WINDOWS[name]
+                log_debug("Snapping window %s (%s)", name, handle)
+                moves.append(
+                    (handle, int(rect.left), int(rect.top), int(rect.width), int(rect.height))
                 )
-        dpg_core.log_info(f"Snapped windows in monitor profile {self.monitor.name}")
+        move_windows(moves)
+        log_info("Snapped windows in monitor profile %s", self.monitor.name)
 
     def resize(self):
         """When the main window is resized, we need to resize the two columns
@@ -702,16 +1144,12 @@ class MonitorProfile(UniqueContainer):
         serialized_monitor_profile : dict[str, list[float]]
             Serialized monitor profile
         """
-        dpg_core.log_info(f"Serializing monitor profile: {self.id}")
+        log_info("Serializing monitor profile: %s", self.id)
         serialized_monitor_profile = {
-            "xlines": sorted(
-                dpg_core.get_value(xline) / self.monitor.work.width for xline in self._xlines
-            ),
-            "ylines": sorted(
-                dpg_core.get_value(yline) / self.monitor.work.height for yline in self._ylines
-            ),
+            "xlines": [xline / self.monitor.work.width for xline in self._xline_values],
+            "ylines": [yline / self.monitor.work.height for yline in self._yline_values],
         }
-        dpg_core.log_info(f"Serialized monitor profile: {self.id}")
+        log_info("Serialized monitor profile: %s", self.id)
         return serialized_monitor_profile
 
     def load_dict(self, serialized_monitor_profile: dict[str, list[float]]) -> None:
@@ -722,16 +1160,16 @@ class MonitorProfile(UniqueContainer):
         serialized_monitor_profile : dict[str, list[float]]
             Dictionary to load
         """
-        dpg_core.log_info(f"Loading monitor profile {self.id}")
+        log_info("Loading monitor profile %s", self.id)
         for xline in self._xlines:
             dpg_core.delete_drag_line(self._plot_id, xline)
         for yline in self._ylines:
             dpg_core.delete_drag_line(self._plot_id, yline)
 
-        dpg_core.log_debug("Setting loaded ylines")
-        ylines = []
+        log_debug("Setting loaded ylines")
+        ylines = {}
         for row, value in enumerate(serialized_monitor_profile["ylines"]):
-            dpg_core.log_debug("Loading y lines")
+            log_debug("Loading y lines")
             yline = int(value * self.monitor.work.height)
             name = f"yline{row}-{self.id}"
             dpg_core.add_drag_line(
@@ -742,10 +1180,10 @@ class MonitorProfile(UniqueContainer):
                 default_value=yline,
                 callback=self.line_callback,
             )
-            ylines.append(name)
+            ylines[name] = yline
 
-        dpg_core.log_debug("Setting loaded xlines")
-        xlines = []
+        log_debug("Setting loaded xlines")
+        xlines = {}
         for col, value in enumerate(serialized_monitor_profile["xlines"]):
             yline = int(value * self.monitor.work.width)
             name = f"xline{col}-{self.id}"
@@ -757,16 +1195,18 @@ class MonitorProfile(UniqueContainer):
                 default_value=yline,
                 callback=self.line_callback,
             )
-            xlines.append(name)
+            xlines[name] = yline
 
         self._xlines = xlines
         self._ylines = ylines
+        self._xline_values = sorted(xlines.values())
+        self._yline_values = sorted(ylines.values())
 
         self.set_labels()
         rows, cols = (len(self._ylines) + 1), (len(self._xlines) + 1)
         dpg_core.set_value(self._input_id, [rows, cols])
         self._app_table.set_rows(rows * cols)
-        dpg_core.log_info(f"Loaded monitor profile {self.id}")
+        log_info("Loaded monitor profile %s", self.id)
 
 
 class Profile(UniqueContainer):
@@ -816,11 +1256,12 @@ class Profile(UniqueContainer):
         serialized_profile : dict[str, dict[str, list[float]]]
             The serialized profile
         """
-        dpg_core.log_info(f"Serializing profile {self.id}")
-        serialized_profile = {}
-        for monitor_id, monitor_profile in self._monitor_profiles.items():
-            serialized_profile[monitor_id] = monitor_profile.to_dict()
-        dpg_core.log_info(f"Serialized profile {self.id}")
+        log_info("Serializing profile %s", self.id)
+        serialized_profile = {
+            monitor_id: monitor_profile.to_dict()
+            for monitor_id, monitor_profile in self._monitor_profiles.items()
+        }
+        log_info("Serialized profile %s", self.id)
         return serialized_profile
 
     def load_dict(self, serialized_profile: dict[str, dict[str, list[float]]]):
@@ -831,11 +1272,11 @@ class Profile(UniqueContainer):
         serialized_profile : dict[str, dict[str, list[float]]]
             The serialized profile
         """
-        dpg_core.log_info(f"Loading profile {self.id}")
+        log_info("Loading profile %s", self.id)
         for monitor_id, serialized_monitor_profile in serialized_profile.items():
             monitor_profile = self._monitor_profiles[monitor_id]
             monitor_profile.load_dict(serialized_monitor_profile)
-        dpg_core.log_info(f"Loaded profile {self.id}")
+        log_info("Loaded profile %s", self.id)
 
 
 AppTable.ACTIVE_WINDOWS = get_windows()
@@ -844,29 +1285,51 @@ AppTable.ACTIVE_WINDOWS = get_windows()
 class MainWindow(UniqueContainer):
     """WinSnap's main window"""
 
-    PROFILES_PATH = Path(os.path.expandvars("%APPDATA%")) / "WinSnap" / "profiles.json"
+    # Minimum number of seconds between refreshing the active windows
+    REFRESH_INTERVAL = 0.5
 
     def __init__(self) -> None:
         super().__init__(parent=None)
-        self._profiles: dict[str, Profile] = {}
+        # Profiles keyed by their tab number, the tab label is the profile's parent
+        self._profiles: dict[int, Profile] = {}
+        # The monitor profiles of every profile, kept in sync by update_monitor_profiles
+        self._monitor_profiles: list[MonitorProfile] = []
         self._tab_number = 1
         self._monitors = get_monitors()
+        self._monitor_ids = frozenset(monitor.id for monitor in self._monitors)
+        self._monitor_set_id = None
         self._save_id = "Save##MainWindow-save"
         self._load_id = "Load##MainWindow-load"
         self._status_id = "##MainWindow-status"
         self._status_id_same_line = "##MainWindow-same-line"
+        self._last_refresh = 0.0
+        self._refreshing = False
+        self._windows_fingerprint = None
+        # The contents of the profiles file as of the last save
+        self._saved_payload = None
 
         # Load the serialized profiles on startup
-        if self.PROFILES_PATH.exists():
-            with self.PROFILES_PATH.open("r") as stream:
-                self._saved_profiles = json.load(stream)
+        if self.profiles_path.exists():
+            self._saved_payload = self.profiles_path.read_bytes()
+            self._saved_profiles = load_json(self._saved_payload)
         else:
-            if not self.PROFILES_PATH.parent.exists():
-                os.mkdir(self.PROFILES_PATH.parent)
+            if not self.profiles_path.parent.exists():
+                os.mkdir(self.profiles_path.parent)
             self._saved_profiles = {}
+        # The monitor ids of each saved monitor set, as sets so they can be compared with the
+        # current monitors
+        self._monitor_sets = {
+            monitor_set_id: frozenset(monitor_ids)
+            for monitor_set_id, monitor_ids in self._saved_profiles.get("monitor_sets", {}).items()
+        }
 
         self.init_ui()
 
+    @cached_property
+    def profiles_path(self) -> Path:
+        """Path to the file the profiles are saved to"""
+        return Path(os.path.expandvars("%APPDATA%")) / "WinSnap" / "profiles.json"
+
     def get_or_create_monitor_set_id(self):
         """Get or create a monitor set id
 
@@ -879,19 +1342,31 @@ class MainWindow(UniqueContainer):
         monitor_set_id : str
             UUID string for the monitor set
         """
-        monitor_sets = self._saved_profiles.get("monitor_sets", {})
-        current_monitor_ids = set(monitor.id for monitor in self._monitors)
-        for monitor_set_id, monitor_ids in monitor_sets.items():
-            if set(monitor_ids) == current_monitor_ids:
-                dpg_core.log_debug(f"Found existing monitor set: {monitor_set_id}")
+        # The monitors can't change while WinSnap is running so the id only has to be found once
+        if self._monitor_set_id is not None:
+            return self._monitor_set_id
+
+        for monitor_set_id, monitor_ids in self._monitor_sets.items():
+            if monitor_ids == self._monitor_ids:
+                log_debug("Found existing monitor set: %s", monitor_set_id)
                 break
         else:
             monitor_set_id = str(uuid4())
-            monitor_sets[monitor_set_id] = list(current_monitor_ids)
-            self._saved_profiles["monitor_sets"] = monitor_sets
-            dpg_core.log_info(f"Create new monitor set: {monitor_set_id}")
+            monitor_sets = self._saved_profiles.setdefault("monitor_sets", {})
+            monitor_sets[monitor_set_id] = list(self._monitor_ids)
+            self._monitor_sets[monitor_set_id] = self._monitor_ids
+            log_info("Create new monitor set: %s", monitor_set_id)
+        self._monitor_set_id = monitor_set_id
         return monitor_set_id
 
+    def update_monitor_profiles(self):
+        """Update the flat list of monitor profiles after profiles are added or removed"""
+        self._monitor_profiles = [
+            monitor_profile
+            for profile in self._profiles.values()
+            for monitor_profile in profile.iter_monitor_profiles()
+        ]
+
     def show_status(self, text):
         """Show the status of load and save
 
@@ -917,73 +1392,84 @@ class MainWindow(UniqueContainer):
 
     def save(self, *args, **kwargs):
         """Save the current layout to the profiles file for the set of monitors"""
-        dpg_core.log_info("Saving configuration")
+        log_info("Saving configuration")
         serialized_profiles = [profile.to_dict() for profile in self._profiles.values()]
         monitor_set_id = self.get_or_create_monitor_set_id()
         self._saved_profiles[monitor_set_id] = serialized_profiles
-        with self.PROFILES_PATH.open("w") as stream:
-            json.dump(self._saved_profiles, stream)
-        dpg_core.log_info(f"Successfully saved configuration {monitor_set_id}")
+        payload = dump_json(self._saved_profiles)
+        if payload == self._saved_payload:
+            log_info("Configuration unchanged since the last save")
+        else:
+            # Write to a temporary file and swap it in so a crash mid-write can't corrupt the
+            # saved profiles
+            temp_path = self.profiles_path.with_suffix(".json.tmp")
+            temp_path.write_bytes(payload)
+            os.replace(temp_path, self.profiles_path)
+            self._saved_payload = payload
+        log_info("Successfully saved configuration %s", monitor_set_id)
         self.show_status("Save Successful!")
 
     def load(self, *args, **kwargs):
         """Load a the serialized profiles for the current set of monitors"""
-        dpg_core.log_info("Loading save profile")
+        log_info("Loading save profile")
         monitor_set_id = self.get_or_create_monitor_set_id()
-        dpg_core.log_debug(f"Monitor set ID: {monitor_set_id}")
+        log_debug("Monitor set ID: %s", monitor_set_id)
         serialized_profiles = self._saved_profiles.get(monitor_set_id)
         if not serialized_profiles:
-            dpg_core.log_debug(f"No serialized profile for monitor set ID {monitor_set_id}")
+            log_debug("No serialized profile for monitor set ID %s", monitor_set_id)
             return
-        dpg_core.log_debug(f"Found serialized profile for monitor set ID {monitor_set_id}")
+        log_debug("Found serialized profile for monitor set ID %s", monitor_set_id)
         self.show_status("Load Successful!")
 
-        for label in self._profiles:
-            dpg_core.delete_item(label)
+        # Remove every tab at once, which also removes the "+" button so add it back
+        dpg_core.delete_item("##MainWindow-tabbar", children_only=True)
+        self.add_tab_button()
         self._profiles = {}
+        self._monitor_profiles = []
         self._tab_number = 1
 
-        for serialized_profile in serialized_profiles:
-            profile = self.add_tab()
-            # Ensure the plot width is accurate
-            self.resize_callback(None, None)
-            profile.load_dict(serialized_profile)
-
+        profiles = [self.add_tab() for _ in serialized_profiles]
+        # Ensure the plot widths are accurate before loading the grids into them
         self.resize_callback(None, None)
-        dpg_core.log_info(f"Successfully loaded saved profile {monitor_set_id}")
+        for profile, serialized_profile in zip(profiles, serialized_profiles):
+            profile.load_dict(serialized_profile)
+        log_info("Successfully loaded saved profile %s", monitor_set_id)
 
     def add_tab(self, *args, **kwargs):
         """Add a profile tab"""
-        dpg_core.log_debug("Adding profile tab...")
+        log_debug("Adding profile tab...")
         label = f"{self._tab_number}##MainWindow-tab{self._tab_number}"
         with dpg_simple.tab(label, parent="##MainWindow-tabbar", closable=False, no_tooltip=True):
             profile = Profile(label, self._monitors)
-            self._profiles[label] = profile
+            self._profiles[self._tab_number] = profile
         self._tab_number += 1
+        self.update_monitor_profiles()
 
         # If we previously only had one tab then we need to make the first tab closable
         if len(self._profiles) == 2:
-            label = list(self._profiles)[0]  # get the label of the first tab
-            dpg_core.configure_item(label, closable=dpg_core.get_value(label))
+            first_label = next(iter(self._profiles.values())).parent
+            dpg_core.configure_item(first_label, closable=dpg_core.get_value(first_label))
 
-        dpg_core.log_info(f"Profile {label} successfully added")
+        log_info("Profile %s successfully added", label)
         return profile
 
     def remove_tab(self, *args, **kwargs):
         """Close a tab"""
         # Due to https://github.com/hoffstadt/DearPyGui/issues/429, when a tab is closed, we have to
         # search for the tab to remove the profile itself
-        remove = set()
-        for label in self._profiles:
+        remove = []
+        for tab_number, profile in self._profiles.items():
+            label = profile.parent
             if dpg_core.is_item_shown(label):
                 dpg_core.configure_item(label, closable=dpg_core.get_value(label))
             else:
                 dpg_core.delete_item(label)
-                remove.add(label)
-        self._profiles = {
-            label: self._profiles[label] for label in self._profiles if label not in remove
-        }
-        dpg_core.log_info(f"Profiles {remove} successfully closed")
+                remove.append(tab_number)
+        for tab_number in remove:
+            del self._profiles[tab_number]
+        if remove:
+            self.update_monitor_profiles()
+        log_info("Profiles %s successfully closed", remove)
 
     def init_ui(self):
         """Initialize the main window's UI
@@ -1005,35 +1491,68 @@ class MainWindow(UniqueContainer):
             )
             with main_window_tab_bar_ctx:
                 self.add_tab()
-                dpg_core.add_tab_button(
-                    "+##MainWindow-btn",
-                    parent="##MainWindow-tabbar",
-                    callback=self.add_tab,
-                    trailing=True,
-                    no_tooltip=True,
-                )
+                self.add_tab_button()
+
+    def add_tab_button(self):
+        """Add the button that adds a profile tab to the end of the tab bar"""
+        dpg_core.add_tab_button(
+            "+##MainWindow-btn",
+            parent="##MainWindow-tabbar",
+            callback=self.add_tab,
+            trailing=True,
+            no_tooltip=True,
+        )
 
     def resize_callback(self, *args, **kwargs):
         """Handle when the main window is resized"""
-        for profile in self._profiles.values():
-            for monitor_profile in profile.iter_monitor_profiles():
-                monitor_profile.resize()
+        for monitor_profile in self._monitor_profiles:
+            monitor_profile.resize()
 
     def refresh_windows(self):
-        """Refresh the currently active windows"""
-        new_active_windows = get_windows()
-        if new_active_windows != AppTable.ACTIVE_WINDOWS:
-            dpg_core.log_debug("Active windows changed, refreshing tables")
-            AppTable.ACTIVE_WINDOWS = new_active_windows
-            for profile in self._profiles.values():
-                for monitor_profile in profile.iter_monitor_profiles():
+        """Refresh the currently active windows
+
+        This is called on every mouse click so the refresh is throttled to at most once every
+        ``REFRESH_INTERVAL`` seconds.
+        """
+        now = monotonic()
+        if self._refreshing or now - self._last_refresh < self.REFRESH_INTERVAL:
+            return
+        self._refreshing = True
+        try:
+            # Enumerating the windows is cheap compared to looking up the applications they belong
+            # to. Most clicks don't open or close a window so only look up the applications when
+            # the windows have changed. Only the hash of the windows is kept so checking for a
+            # change is a single integer comparison.
+            top_level_windows = enum_windows()
+            fingerprint = hash(
+                frozenset(
+                    (window.handle, window.process_id, window.text) for window in top_level_windows
+                )
+            )
+            if fingerprint == self._windows_fingerprint:
+                return
+            self._windows_fingerprint = fingerprint
+
+            new_active_windows = get_windows(top_level_windows)
+            if new_active_windows != AppTable.ACTIVE_WINDOWS:
+                log_debug("Active windows changed, refreshing tables")
+                AppTable.ACTIVE_WINDOWS = new_active_windows
+                # Forget the borders of the windows that have closed
+                for handle in set(_border_cache) - set(new_active_windows.values()):
+                    del _border_cache[handle]
+                for monitor_profile in self._monitor_profiles:
                     monitor_profile._app_table.refresh_available_windows()
+        finally:
+            self._refreshing = False
+            self._last_refresh = monotonic()
 
 
 def main():
     parser = argparse.ArgumentParser(description="Winsnap: Snap windows into a customizable grid")
     parser.add_argument("--debug", action="store_true", help="Show the log window")
     args = parser.parse_args()
+    global DEBUG
+    DEBUG = args.debug
     main_window = MainWindow()
 
     def mouse_click_cb(sender, data):
@@ -1045,7 +1564,7 @@ def main():
     dpg_core.set_mouse_click_callback(mouse_click_cb)
     dpg_core.set_start_callback(startup_cb)
     dpg_core.set_resize_callback(main_window.resize_callback, handler="Main Window")
-    scale = ctypes.windll.shcore.GetScaleFactorForDevice(0) / 100
+    scale = shcore.GetScaleFactorForDevice(0) / 100
     dpg_core.set_global_font_scale(scale)
     w, h = dpg_core.get_main_window_size()
     dpg_core.set_main_window_size(int(w * scale), int(h * scale))